@@ -0,0 +1,106 @@
+"""
+Per-cell string helpers for survey123_to_pdf.
+
+These run for every cell of every rendered row, so they live in their own
+module that can optionally be compiled with Cython (see build_hotpath.py). When no
+compiled extension is present this plain-Python module is imported instead.
+"""
+
+from __future__ import annotations
+import re
+import math
+from typing import List, Dict, Tuple
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+_SLUG_DROP = re.compile(r"[^\w\s\-\.]+", re.UNICODE)
+_SLUG_WS = re.compile(r"\s+")
+# Cell texts (after strip + lower) that count as unanswered
+EMPTY_TOKENS = frozenset({"nan", "none", "null"})
+# Same escapes as html.escape(), plus newlines as <br/>, in a single pass
+_XML_TRANS = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;",
+    "\n": "<br/>",
+})
+
+
+def slugify(text: str, max_len: int = 80) -> str:
+    text = str(text or "").strip()
+    text = _SLUG_WS.sub("_", _SLUG_DROP.sub("", text))
+    return text[:max_len] or "row"
+
+
+def is_empty(val) -> bool:
+    """True if a cell is effectively empty."""
+    if val is None:
+        return True
+    # pandas hands us float NaN for blank cells; skip the str() round-trip
+    if isinstance(val, float):
+        return math.isnan(val)
+    if not isinstance(val, str):
+        val = str(val)
+    s = val.strip()
+    return not s or s.lower() in EMPTY_TOKENS
+
+
+def base_and_index(col: str) -> Tuple[str, int]:
+    """Split a pandas-mangled duplicate column name into (base, index).
+    Example: "Question" -> ("Question", 0), "Question.1" -> ("Question", 1)
+    """
+    s = col.strip()
+    head, sep, tail = s.rpartition(".")
+    if sep and tail.isdecimal():
+        return head.strip(), int(tail)
+    return s, 0
+
+
+def as_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """Escape text for XML/HTML and preserve newlines as <br/>."""
+    return Paragraph(("" if text is None else str(text)).translate(_XML_TRANS), style)
+
+
+def extract_file_sections(
+    record: Dict[str, object],
+    columns: Tuple[str, ...],
+    col_meta: Dict[str, Tuple[str, int]],
+    col_action: Dict[str, str]
+) -> List[List[Tuple[str, str]]]:
+    """Return ordered blocks of (question, answer) pairs for file-related repeats.
+
+    ``col_action`` maps a base name to "file" (part of a block), "sep" (block
+    separator) or "dq" (start of the data-quality questions, ends the scan).
+    """
+    sections: List[List[Tuple[str, str]]] = []
+    current: List[Tuple[str, str]] = []
+
+    for col in columns:
+        base = col_meta[col][0]  # already stripped by base_and_index
+        action = col_action.get(base)
+
+        if action == "file":
+            current.append((base, col))
+            continue
+
+        # Anything else closes the current block; the DQ questions end the scan
+        if current:
+            sections.append(current)
+            current = []
+        if action == "dq":
+            break
+
+    if current:
+        sections.append(current)
+
+    file_sections: List[List[Tuple[str, str]]] = []
+    for block in sections:
+        qa_block: List[Tuple[str, str]] = []
+        for base, col in block:
+            val = record.get(col, None)
+            if not is_empty(val):
+                qa_block.append((base, str(val)))
+        if qa_block:
+            file_sections.append(qa_block)
+
+    return file_sections
+
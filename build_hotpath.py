@@ -0,0 +1,24 @@
+"""
+Optional: compile the per-cell helpers in _hotpath.py with Cython.
+
+    pip install cython setuptools
+    python build_hotpath.py build_ext --inplace
+
+This is deliberately not named setup.py: it needs Cython at import time,
+and the exporter itself has no packaging step.
+
+The resulting extension module is picked up automatically in place of
+_hotpath.py; without it the exporter runs unchanged on the pure-Python code.
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name="survey123_to_pdf_hotpath",
+    ext_modules=cythonize(
+        [Extension("_hotpath", ["_hotpath.py"])],
+        # Keep plain-Python semantics: the annotations are hints, not C types
+        compiler_directives={"language_level": 3, "annotation_typing": False},
+    ),
+)
@@ -24,11 +24,12 @@ python survey123_to_pdf.py input.csv -o out_pdfs --rows 0,2,5-7
 from __future__ import annotations
 import argparse
 import os
-import re
+import csv
 import sys
-import math
-import html
-from typing import Iterable, List, Dict, Tuple, Optional
+import functools
+import itertools
+import multiprocessing
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
 from io import BytesIO
 from pathlib import Path
 import pkgutil
@@ -40,21 +41,47 @@ except ImportError:  # pragma: no cover - Python <3.9 fallback
 
 import pandas as pd
 
+try:
+    from ._hotpath import (  # type: ignore[import-not-found]
+        EMPTY_TOKENS, slugify, is_empty, base_and_index, as_paragraph,
+        extract_file_sections as _extract_file_sections,
+    )
+except ImportError:  # run as a script rather than from a package
+    from _hotpath import (
+        EMPTY_TOKENS, slugify, is_empty, base_and_index, as_paragraph,
+        extract_file_sections as _extract_file_sections,
+    )
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # optional: faster streaming CSV parser
+    pa = pa_csv = None
+
 # ReportLab / Platypus imports
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, HRFlowable
+    SimpleDocTemplate, Spacer, HRFlowable
 )
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab import rl_config
+
+# Write Flate streams as raw binary rather than wrapping them in ASCII85,
+# which costs a pure-Python encoding pass per stream and inflates the output.
+rl_config.useA85 = 0
+
+# Rows per pandas chunk when streaming the CSV (bytes per block for pyarrow)
+CSV_CHUNKSIZE = 4096
+ARROW_BLOCK_SIZE = 4 << 20
 
 # ---------- Utilities ----------
 
-def parse_row_ranges(expr: str, max_index: int) -> List[int]:
+def parse_row_ranges(expr: str, max_index: int, min_index: int = 0) -> List[int]:
     """Parse expressions like '0,2,5-7' into row indexes.
-    Clamps each index to [0, max_index].
+    Clamps each index to [min_index, max_index].
     """
     result = set()
     for part in expr.split(","):
@@ -69,65 +96,58 @@ def parse_row_ranges(expr: str, max_index: int) -> List[int]:
                 continue
             if start > end:
                 start, end = end, start
-            for i in range(start, end + 1):
-                if 0 <= i <= max_index:
-                    result.add(i)
+            result.update(range(max(start, min_index), min(end, max_index) + 1))
         else:
             try:
                 i = int(part)
-                if 0 <= i <= max_index:
+                if min_index <= i <= max_index:
                     result.add(i)
             except ValueError:
                 pass
     return sorted(result)
 
 
-def slugify(text: str, max_len: int = 80) -> str:
-    text = str(text or "").strip()
-    text = re.sub(r"[^\w\s\-\.]+", "", text, flags=re.UNICODE)
-    text = re.sub(r"\s+", "_", text)
-    return text[:max_len] or "row"
-
-
-def is_empty(val) -> bool:
-    """True if a cell is effectively empty."""
-    if val is None:
-        return True
-    s = str(val).strip()
-    if s == "" or s.lower() in {"nan", "none", "null"}:
-        return True
-    return False
+def max_row_index(expr: str) -> int:
+    """Highest index parse_row_ranges(expr, ...) could select, or -1 if none.
+    Computed from the bounds alone, so a huge range is not materialized.
+    """
+    highest = -1
+    for part in expr.split(","):
+        part = part.strip()
+        try:
+            if "-" in part:
+                a, b = part.split("-", 1)
+                highest = max(highest, int(a), int(b))
+            elif part:
+                highest = max(highest, int(part))
+        except ValueError:
+            continue
+    return highest
 
 
-def base_and_index(col: str) -> Tuple[str, int]:
-    """Split a pandas-mangled duplicate column name into (base, index).
-    Example: "Question" -> ("Question", 0), "Question.1" -> ("Question", 1)
-    """
-    m = re.match(r"^(.*?)(?:\.(\d+))?$", col.strip())
-    if m:
-        base = m.group(1).strip()
-        idx = int(m.group(2)) if m.group(2) else 0
-        return base, idx
-    return col, 0
+def nonempty_mask(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized ``not is_empty(cell)`` for every cell of a DataFrame."""
+    def _column(s: pd.Series) -> pd.Series:
+        text = s.astype(str).str.strip()
+        return s.notna() & text.ne("") & ~text.str.lower().isin(EMPTY_TOKENS)
+    return df.apply(_column)
 
 
 def first_value_for_base(
-    row: pd.Series,
-    groups: Dict[str, List[Tuple[int, str]]],
+    record: Dict[str, object],
+    groups_idx: Dict[str, Dict[int, str]],
     base: str,
     idx: int = 0
 ) -> Optional[str]:
     """Return the first non-empty value for the given base header and index."""
-    if base in groups:
-        for i, full in groups[base]:
-            if i == idx:
-                val = row.get(full, None)
-                if not is_empty(val):
-                    return val
-                break
+    full = groups_idx.get(base, {}).get(idx)
+    if full is not None:
+        val = record.get(full, None)
+        if not is_empty(val):
+            return val
     # Fall back to direct lookup (for columns without duplicate suffixes)
-    if base in row.index and not is_empty(row.get(base)):
-        return row.get(base)
+    if base in record and not is_empty(record.get(base)):
+        return record.get(base)
     return None
 
 
@@ -160,50 +180,33 @@ FILE_QUESTION_BASES = {
     "Dependencies",
 }
 
-
-def extract_file_sections(row: pd.Series) -> List[List[Tuple[str, str]]]:
+_DQ_BASES = frozenset(q.strip() for q in DATA_QUALITY_QUESTIONS)
+_FILE_BASES = frozenset(FILE_QUESTION_BASES)
+# Default exclusions (system/meta) for the "General" section
+_DEFAULT_EXCL = frozenset({
+    "ObjectID", "GlobalID", "CreationDate", "EditDate",
+    "Creator", "Editor", "Owner", "Metadata Owner",
+    "Title of Tier I Data Submitted", "Data Pillar",
+    "x", "y"
+}) | _DQ_BASES | _FILE_BASES | {FILE_SECTION_SEPARATOR}
+# How extract_file_sections treats each base name (later entries take precedence)
+_COL_ACTION: Dict[str, str] = {b: "file" for b in _FILE_BASES}
+_COL_ACTION[FILE_SECTION_SEPARATOR] = "sep"
+_COL_ACTION.update((b, "dq") for b in _DQ_BASES)
+
+
+def extract_file_sections(
+    record: Dict[str, object],
+    columns: Tuple[str, ...],
+    col_meta: Dict[str, Tuple[str, int]]
+) -> List[List[Tuple[str, str]]]:
     """Return ordered blocks of (question, answer) pairs for file-related repeats."""
-    dq_bases = {q.strip() for q in DATA_QUALITY_QUESTIONS}
-    sections: List[List[Tuple[str, str]]] = []
-    current: List[Tuple[str, str]] = []
-
-    for col in row.index:
-        base, _ = base_and_index(col)
-        base = base.strip()
-
-        if base in dq_bases:
-            if current:
-                sections.append(current)
-                current = []
-            break
+    return _extract_file_sections(record, columns, col_meta, _COL_ACTION)
 
-        if base == FILE_SECTION_SEPARATOR:
-            if current:
-                sections.append(current)
-                current = []
-            continue
 
-        if base in FILE_QUESTION_BASES:
-            current.append((base, col))
-        else:
-            if current:
-                sections.append(current)
-                current = []
-
-    if current:
-        sections.append(current)
-
-    file_sections: List[List[Tuple[str, str]]] = []
-    for block in sections:
-        qa_block: List[Tuple[str, str]] = []
-        for base, col in block:
-            val = row.get(col, None)
-            if not is_empty(val):
-                qa_block.append((base, str(val)))
-        if qa_block:
-            file_sections.append(qa_block)
-
-    return file_sections
+def ordered_bases(columns: Iterable[str], col_meta: Dict[str, Tuple[str, int]]) -> List[str]:
+    """Return the distinct base names of ``columns`` in first-seen order."""
+    return list({col_meta[c][0]: None for c in columns})
 
 
 def detect_groups(columns: Iterable[str]) -> Tuple[Dict[str, List[Tuple[int, str]]], int]:
@@ -221,21 +224,33 @@ def detect_groups(columns: Iterable[str]) -> Tuple[Dict[str, List[Tuple[int, str
     return groups, max_idx
 
 
-def as_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
-    """Escape text for XML/HTML and preserve newlines as <br/>."""
-    s = "" if text is None else str(text)
-    s = html.escape(s).replace("\n", "<br/>")
-    return Paragraph(s, style)
+def index_groups(groups: Dict[str, List[Tuple[int, str]]]) -> Dict[str, Dict[int, str]]:
+    """Turn detect_groups() output into base_name -> {idx: full_colname} for O(1) lookups."""
+    groups_idx: Dict[str, Dict[int, str]] = {}
+    for base, cols in groups.items():
+        by_idx = groups_idx[base] = {}
+        for i, full in cols:
+            by_idx.setdefault(i, full)  # keep the first column, as a scan would
+    return groups_idx
 
 
-def register_ttf() -> Optional[str]:
-    """Register the bundled DejaVuSans font, returning the family name on success."""
+_TTF_FAMILY = "DejaVuSans"
+_TTF_REL_PATHS = [
+    "dejavu-sans-ttf-2.37/ttf/DejaVuSans.ttf",
+    "DejaVuSans.ttf",
+]
 
-    family = "DejaVuSans"
-    rel_paths = [
-        "dejavu-sans-ttf-2.37/ttf/DejaVuSans.ttf",
-        "DejaVuSans.ttf",
-    ]
+
+@functools.lru_cache(maxsize=1)
+def _load_ttf_bytes() -> Optional[bytes]:
+    """Locate the bundled DejaVuSans.ttf and return its bytes, or None."""
+    # A plain file next to this script is the common case (source checkout,
+    # editable install), so try it before the package-resource machinery.
+    base_dir = Path(__file__).resolve().parent
+    for rel in _TTF_REL_PATHS:
+        candidate = base_dir / rel
+        if candidate.exists():
+            return candidate.read_bytes()
 
     data: Optional[bytes] = None
 
@@ -252,23 +267,21 @@ def register_ttf() -> Optional[str]:
         if not pkg or pkg in seen_packages:
             continue
         seen_packages.append(pkg)
-        for rel in rel_paths:
+        for rel in _TTF_REL_PATHS:
             try:
                 data = pkgutil.get_data(pkg, rel)
             except (FileNotFoundError, ModuleNotFoundError, OSError, ValueError):
                 continue
             if data:
-                break
-        if data:
-            break
+                return data
 
-    if data is None and 'importlib_resources' in globals():
+    if 'importlib_resources' in globals():
         for pkg in seen_packages:
             try:
                 resources_root = importlib_resources.files(pkg)  # type: ignore[attr-defined]
-            except (ModuleNotFoundError, AttributeError):
+            except (ModuleNotFoundError, AttributeError, TypeError):
                 continue
-            for rel in rel_paths:
+            for rel in _TTF_REL_PATHS:
                 try:
                     with resources_root.joinpath(rel).open("rb") as handle:  # type: ignore[attr-defined]
                         data = handle.read()
@@ -276,29 +289,105 @@ def register_ttf() -> Optional[str]:
                 except (FileNotFoundError, IsADirectoryError):
                     continue
             if data:
-                break
+                return data
 
-    if data is None:
-        base_dir = Path(__file__).resolve().parent
-        for rel in rel_paths:
-            candidate = base_dir / rel
-            if candidate.exists():
-                data = candidate.read_bytes()
-                break
+    return None
 
-    if data is None:
-        sys.stderr.write("[warn] Could not load bundled DejaVuSans.ttf; using default ReportLab fonts.\n")
-        return None
 
+def _register_ttf_data(data: bytes) -> Optional[str]:
+    """Register TTF bytes under the DejaVuSans family, returning it on success."""
     try:
         font_buffer = BytesIO(data)
-        pdfmetrics.registerFont(TTFont(family, font_buffer))
-        return family
+        pdfmetrics.registerFont(TTFont(_TTF_FAMILY, font_buffer))
+        return _TTF_FAMILY
     except Exception as exc:
         sys.stderr.write(f"[warn] Failed to register bundled font: {exc}\n")
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def register_ttf() -> Optional[str]:
+    """Register the bundled DejaVuSans font, returning the family name on success.
+
+    Memoized, so repeated calls (e.g. one per pool worker) parse the TTF once.
+    """
+    data = _load_ttf_bytes()
+    if data is None:
+        sys.stderr.write("[warn] Could not load bundled DejaVuSans.ttf; using default ReportLab fonts.\n")
+        return None
+    return _register_ttf_data(data)
+
+
+def _open_arrow_csv(path: str):
+    """Open a streaming pyarrow CSV reader; returns it with pandas-style column names."""
+    with open(path, encoding="utf-8-sig", newline="") as handle:
+        header = next(csv.reader(handle), [])
+    # Let pandas parse just the header so duplicate names are mangled identically
+    names = list(pd.read_csv(path, encoding="utf-8-sig", nrows=0).columns)
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        # Survey123 answers (and sometimes headers) routinely contain line breaks
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={n: pa.string() for n in header},
+            strings_can_be_null=True,
+        ),
+    )
+    if reader.schema.names != header or len(names) != len(header):
+        raise pa.ArrowInvalid("header does not match the pandas reading of it")
+    return reader, names
+
+
+def iter_csv_chunks(path: str) -> Iterator[pd.DataFrame]:
+    """Yield the CSV in DataFrame chunks.
+
+    Uses pyarrow's faster streaming parser when it is installed, otherwise
+    pandas' C engine in chunks of CSV_CHUNKSIZE rows. If pyarrow rejects part
+    of the file (e.g. a ragged row), pandas takes over from the first row not
+    yet yielded, so every row is produced exactly once. Every column is read
+    as text so that type inference cannot differ between chunks (e.g. an
+    integer column that only has blanks in some chunks).
+    """
+    done = 0
+    if pa_csv is not None:
+        try:
+            reader, names = _open_arrow_csv(path)
+        except (pa.ArrowInvalid, UnicodeDecodeError, pd.errors.ParserError) as exc:
+            sys.stderr.write(f"[warn] pyarrow could not read CSV ({exc}); falling back to pandas.\n")
+        else:
+            try:
+                for batch in reader:
+                    if batch.num_rows:
+                        yield pa.Table.from_batches([batch]).rename_columns(names).to_pandas()
+                        done += batch.num_rows
+                return
+            except pa.ArrowInvalid as exc:
+                sys.stderr.write(
+                    f"[warn] pyarrow could not read CSV ({exc}); continuing with pandas from row {done}.\n"
+                )
+
+    # UTF-8 with BOM (utf-8-sig) tends to fit Survey123 exports
+    try:
+        reader = pd.read_csv(path, encoding="utf-8-sig", dtype=str, chunksize=CSV_CHUNKSIZE)
+        first = next(reader, None)
+    except UnicodeDecodeError:
+        reader = pd.read_csv(path, dtype=str, chunksize=CSV_CHUNKSIZE)  # fallback
+        first = next(reader, None)
+    if first is None:
+        return
+    # Skip the rows pyarrow already yielded by parsed record rather than with
+    # skiprows: skiprows counts blank lines, which neither parser yields as rows
+    for chunk in itertools.chain([first], reader):
+        if done:
+            n = min(done, len(chunk))
+            chunk = chunk.iloc[n:]
+            done -= n
+            if chunk.empty:
+                continue
+        yield chunk
+
+
 # ---------- PDF Rendering ----------
 
 def _footer(canvas, doc, title_text: str):
@@ -311,48 +400,9 @@ def _footer(canvas, doc, title_text: str):
     canvas.restoreState()
 
 
-def build_pdf_for_row(
-    row: pd.Series,
-    groups: Dict[str, List[Tuple[int, str]]],
-    out_path: str,
-    font_family: Optional[str]
-):
-    """Create a single PDF for the given DataFrame row."""
-    # Title: prefer common title-ish fields, else fall back to GlobalID/row index
-    candidates = ["Title", "Title of Tier I Data Submitted", "GlobalID"]
-    heading = None
-    for c in candidates:
-        if not c:
-            continue
-        base, idx = base_and_index(c)
-        # find the actual column name for index 0
-        colname = None
-        if base in groups:
-            for i, full in groups[base]:
-                if i == 0:
-                    colname = full
-                    break
-        if not colname and c in row.index:
-            colname = c
-        if colname and not is_empty(row.get(colname, None)):
-            value = row[colname]
-            heading = str(value) if base == "Title of Tier I Data Submitted" else f"{base}: {value}"
-            break
-
-    if not heading:
-        heading = f"Submission {row.name}"
-
-    # Prepare document
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    doc = SimpleDocTemplate(
-        out_path,
-        pagesize=A4,
-        leftMargin=20*mm, rightMargin=20*mm,
-        topMargin=18*mm, bottomMargin=18*mm,
-        title=heading
-    )
-
-    # Styles
+@functools.lru_cache(maxsize=4)
+def _make_styles(font_family: Optional[str]) -> Tuple[ParagraphStyle, ParagraphStyle, ParagraphStyle, ParagraphStyle]:
+    """Return the (Question, Answer, H1, H2) paragraph styles, built once per font."""
     styles = getSampleStyleSheet()
     # If custom TTF given, derive styles from it
     if font_family:
@@ -401,6 +451,69 @@ def build_pdf_for_row(
         spaceAfter=6,
     )
 
+    return Question, Answer, h1, h2
+
+
+def build_pdf_for_row(
+    row: pd.Series,
+    groups: Dict[str, List[Tuple[int, str]]],
+    col_meta: Dict[str, Tuple[str, int]],
+    out_path: str,
+    font_family: Optional[str]
+):
+    """Create a single PDF for the given DataFrame row."""
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    columns = tuple(row.index)
+    build_pdf_for_record(row.to_dict(), columns, col_meta, index_groups(groups),
+                         ordered_bases(columns, col_meta),
+                         out_path, font_family, row.name)
+
+
+def build_pdf_for_record(
+    record: Dict[str, object],
+    columns: Tuple[str, ...],
+    col_meta: Dict[str, Tuple[str, int]],
+    groups_idx: Dict[str, Dict[int, str]],
+    base_order: List[str],
+    out_path: str,
+    font_family: Optional[str],
+    row_label
+):
+    """Create a single PDF for one row given as a plain {column: value} dict."""
+    # Title: prefer common title-ish fields, else fall back to GlobalID/row index
+    candidates = ["Title", "Title of Tier I Data Submitted", "GlobalID"]
+    heading = None
+    for c in candidates:
+        if not c:
+            continue
+        base, idx = col_meta.get(c) or base_and_index(c)
+        # find the actual column name for index 0
+        colname = groups_idx.get(base, {}).get(0)
+        if not colname and c in record:
+            colname = c
+        if colname and not is_empty(record.get(colname, None)):
+            value = record[colname]
+            heading = str(value) if base == "Title of Tier I Data Submitted" else f"{base}: {value}"
+            break
+
+    if not heading:
+        heading = f"Submission {row_label}"
+
+    # Prepare document (the output directory must already exist)
+    doc = SimpleDocTemplate(
+        out_path,
+        pagesize=A4,
+        leftMargin=20*mm, rightMargin=20*mm,
+        topMargin=18*mm, bottomMargin=18*mm,
+        title=heading
+    )
+
+    Question, Answer, h1, h2 = _make_styles(font_family)
+
+    # Spacers and rules are created fresh for every use on purpose: when a
+    # flowable does not fit, ReportLab marks it with ``_postponed`` and never
+    # clears it, so a shared instance raises LayoutError the next time it
+    # lands at the bottom of a frame.
     story: List = []
 
     # Title
@@ -410,8 +523,8 @@ def build_pdf_for_row(
 
     # Capture Metadata Owner and Data Pillar (if present)
     meta_items = []
-    metadata_owner = first_value_for_base(row, groups, "Metadata Owner")
-    data_pillar = first_value_for_base(row, groups, "Data Pillar")
+    metadata_owner = first_value_for_base(record, groups_idx, "Metadata Owner")
+    data_pillar = first_value_for_base(record, groups_idx, "Data Pillar")
     if not is_empty(metadata_owner):
         meta_items.append(("Metadata Owner", metadata_owner))
     if not is_empty(data_pillar):
@@ -423,39 +536,20 @@ def build_pdf_for_row(
     if meta_items:
         story.append(Spacer(1, 6))
 
-    # Build list of base names in original order
-    base_order = []
-    seen = set()
-    for col in row.index:
-        base, idx = base_and_index(col)
-        if base not in seen:
-            seen.add(base)
-            base_order.append(base)
-
-    # Default exclusions (system/meta)
-    dq_bases = {q.strip() for q in DATA_QUALITY_QUESTIONS}
-    default_excl = {
-        "ObjectID", "GlobalID", "CreationDate", "EditDate",
-        "Creator", "Editor", "Owner", "Metadata Owner",
-        "Title of Tier I Data Submitted", "Data Pillar",
-        "x", "y"
-    } | dq_bases | FILE_QUESTION_BASES | {FILE_SECTION_SEPARATOR}
-    exclusions = set(default_excl)
-
     # GENERAL (non-repeated) questions
     general_items = []
     for base in base_order:
-        if base in exclusions:
+        if base in _DEFAULT_EXCL:
             continue
-        cols = groups.get(base, [])
+        cols = groups_idx.get(base, {})
         if len(cols) == 1:  # only index 0 exists
-            _, c0 = cols[0]
-            val = row.get(c0, None)
+            (c0,) = cols.values()
+            val = record.get(c0, None)
             if not is_empty(val):
                 general_items.append((base, val))
 
     # FILE / REPEATED BLOCKS
-    file_sections = extract_file_sections(row)
+    file_sections = extract_file_sections(record, columns, col_meta)
 
     for idx, block_items in enumerate(file_sections, start=1):
         story.append(Spacer(1, 6))
@@ -479,7 +573,7 @@ def build_pdf_for_row(
     dq_items = []
     for question in DATA_QUALITY_QUESTIONS:
         base = question.strip()
-        val = first_value_for_base(row, groups, base)
+        val = first_value_for_base(record, groups_idx, base)
         if is_empty(val):
             answer = "No response provided."
         else:
@@ -500,6 +594,35 @@ def build_pdf_for_row(
                      onLaterPages=lambda c, d: _footer(c, d, heading))
 
 
+# Per-file layout, set once in each pool worker by _init_worker
+_worker_layout: Optional[tuple] = None
+
+
+def _init_worker(
+    columns: Tuple[str, ...],
+    groups_idx: Dict[str, Dict[int, str]],
+    col_meta: Dict[str, Tuple[str, int]],
+    base_order: List[str],
+    font_family: Optional[str]
+):
+    """Pool initializer: keep the row-independent layout and register the font."""
+    global _worker_layout
+    # main() already tried the font and warned if it failed; only a success is
+    # repeated here (a no-op for forked workers, which inherit the registration)
+    if font_family:
+        font_family = register_ttf()
+    _worker_layout = (columns, groups_idx, col_meta, base_order, font_family)
+
+
+def _render_one(task) -> str:
+    """Pool worker: render one record, returning the output path."""
+    i, record, outfile = task
+    columns, groups_idx, col_meta, base_order, font_family = _worker_layout
+    build_pdf_for_record(record, columns, col_meta, groups_idx, base_order,
+                         outfile, font_family, i)
+    return outfile
+
+
 # ---------- Main ----------
 
 def main():
@@ -511,63 +634,107 @@ def main():
 
     args = ap.parse_args()
 
-    # Register bundled font for wide Unicode coverage
+    # Stream the CSV so memory stays bounded by the chunk, not the file
+    os.makedirs(args.outdir, exist_ok=True)
+    # One listing up front instead of an exists() call per candidate name.
+    # Compared case-insensitively so case-insensitive filesystems (macOS,
+    # Windows) cannot overwrite an existing PDF.
+    taken_names = {name.casefold() for name in os.listdir(args.outdir)}
+    written = 0
+    offset = 0
+    # With --rows, stop reading once the highest requested index is passed
+    max_row = max_row_index(args.rows) if args.rows else None
+
+    chunks = iter_csv_chunks(args.csv)
+    first = next(chunks, None)
+    if first is None:
+        sys.exit("No rows selected.")
+    groups, _ = detect_groups(first.columns)
+    groups_idx = index_groups(groups)
+    # Column splitting is row-independent; do it once for the whole file
+    col_meta = {c: base_and_index(c) for c in first.columns}
+    columns = tuple(first.columns)
+    base_order = ordered_bases(columns, col_meta)
+
+    # Register the bundled font for wide Unicode coverage; done here first so
+    # a missing font is reported once rather than once per worker
     font_family = register_ttf()
 
-    # Load CSV; UTF-8 with BOM (utf-8-sig) tends to fit Survey123 exports
-    try:
-        df = pd.read_csv(args.csv, encoding="utf-8-sig")
-    except UnicodeDecodeError:
-        df = pd.read_csv(args.csv)  # fallback
-
-    groups, _ = detect_groups(df.columns)
-
-    # Determine row selection
-    if args.rows:
-        selection = parse_row_ranges(args.rows, len(df) - 1)
-    else:
-        selection = list(df.index)
+    # The layout goes to each worker once, so tasks only carry the row itself
+    with multiprocessing.Pool(os.cpu_count(), initializer=_init_worker,
+                              initargs=(columns, groups_idx, col_meta, base_order,
+                                        font_family)) as pool:
+        for chunk in itertools.chain([first], chunks):
+            # Determine row selection (absolute indexes falling in this chunk)
+            last = offset + len(chunk) - 1
+            if args.rows:
+                selection = parse_row_ranges(args.rows, last, min_index=offset)
+            else:
+                selection = list(range(offset, last + 1))
+            positions = [i - offset for i in selection]
+            offset = last + 1
+            past_max = max_row is not None and offset > max_row
+            if not selection:
+                if past_max:
+                    break
+                continue
 
-    if not selection:
-        sys.exit("No rows selected.")
+            # Resolve output filenames up front so de-duplication stays deterministic
+            tasks = []
+            # Plain dicts are much cheaper to index than per-row Series. Empty
+            # cells are dropped in one vectorized pass, so later lookups simply
+            # miss instead of running is_empty() on every cell.
+            sub = chunk.iloc[positions]
+            names = sub.columns.to_numpy()
+            keep = nonempty_mask(sub).to_numpy()
+            # Share one str object per distinct answer within the chunk: repeated
+            # boilerplate is common, and pickle then sends each value once per batch
+            str_pool: Dict[str, str] = {}
+            records = [
+                {c: str_pool.setdefault(v, v) for c, v in zip(names[k], values[k])}
+                for values, k in zip(sub.to_numpy(dtype=object), keep)
+            ]
+            for i, record in zip(selection, records):
+                # Use a meaningful filename
+                title_candidates = ["Title", "Title of Tier I Data Submitted", "GlobalID"]
+                title_val = None
+                for c in title_candidates:
+                    if not c:
+                        continue
+                    base, idx = col_meta.get(c) or base_and_index(c)
+                    # try exact match, then base 0
+                    if c in record and not is_empty(record[c]):
+                        title_val = record[c]
+                        break
+                    full = groups_idx.get(base, {}).get(0)
+                    if full is not None and not is_empty(record.get(full)):
+                        title_val = record.get(full)
+                    if title_val:
+                        break
 
-    # Render
-    os.makedirs(args.outdir, exist_ok=True)
-    used_names = set()
-    for i in selection:
-        row = df.loc[i]
-        # Use a meaningful filename
-        title_candidates = ["Title", "Title of Tier I Data Submitted", "GlobalID"]
-        title_val = None
-        for c in title_candidates:
-            if not c:
-                continue
-            base, idx = base_and_index(c)
-            # try exact match, then base 0
-            if c in row.index and not is_empty(row[c]):
-                title_val = row[c]
-                break
-            if base in groups:
-                for gi, full in groups[base]:
-                    if gi == 0 and not is_empty(row.get(full)):
-                        title_val = row.get(full)
+                slug = slugify(title_val if title_val else f"row_{i}")
+                base_slug = slug or f"row_{i}"
+                candidate = base_slug
+                suffix = 1
+                while True:
+                    filename = f"{candidate}.pdf"
+                    if filename.casefold() not in taken_names:
+                        taken_names.add(filename.casefold())
+                        outfile = os.path.join(args.outdir, filename)
                         break
-            if title_val:
+                    suffix += 1
+                    candidate = f"{base_slug}_{suffix}"
+                tasks.append((i, record, outfile))
+
+            # Render; rows are independent, so spread them across all cores
+            for outfile in pool.imap_unordered(_render_one, tasks, chunksize=4):
+                print(f"✔ Wrote {outfile}")
+                written += 1
+            if past_max:
                 break
 
-        slug = slugify(title_val if title_val else f"row_{i}")
-        base_slug = slug or f"row_{i}"
-        candidate = base_slug
-        suffix = 1
-        while True:
-            outfile = os.path.join(args.outdir, f"{candidate}.pdf")
-            if candidate not in used_names and not os.path.exists(outfile):
-                used_names.add(candidate)
-                break
-            suffix += 1
-            candidate = f"{base_slug}_{suffix}"
-        build_pdf_for_row(row, groups, outfile, font_family)
-        print(f"✔ Wrote {outfile}")
+    if not written:
+        sys.exit("No rows selected.")
 
 if __name__ == "__main__":
     main()
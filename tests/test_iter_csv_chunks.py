@@ -0,0 +1,69 @@
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import survey123_to_pdf  # noqa: E402
+
+
+def _write_csv(path, rows, header=("id", "Question", "Question")):
+    with open(path, "w", newline="", encoding="utf-8-sig") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _read_ids(path):
+    ids = []
+    for chunk in survey123_to_pdf.iter_csv_chunks(str(path)):
+        ids.extend(int(v) for v in chunk["id"])
+        columns = list(chunk.columns)
+    return ids, columns
+
+
+def test_ragged_row_past_first_block_falls_back_without_losing_rows(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(survey123_to_pdf, "ARROW_BLOCK_SIZE", 1 << 14)
+    path = tmp_path / "ragged.csv"
+    rows = [[i, "line 1\nline 2" if i % 7 == 0 else "answer", "x"] for i in range(5000)]
+    rows[4990] = [4990, "short"]  # one field missing, far past the first block
+    _write_csv(path, rows)
+
+    ids, columns = _read_ids(path)
+
+    assert ids == list(range(5000))
+    assert columns == ["id", "Question", "Question.1"]
+
+
+def test_header_with_quoted_newline(tmp_path):
+    path = tmp_path / "header.csv"
+    _write_csv(path, [[0, "a", "b"], [1, "c", "d"]], header=("id", "Multi\nline", "Multi\nline"))
+
+    ids, columns = _read_ids(path)
+
+    assert ids == [0, 1]
+    assert columns == ["id", "Multi\nline", "Multi\nline.1"]
+
+
+def test_ragged_row_after_blank_lines_yields_each_row_once(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(survey123_to_pdf, "ARROW_BLOCK_SIZE", 1 << 14)
+    path = tmp_path / "blank_lines.csv"
+    rows = [[i, "answer", "x"] for i in range(5000)]
+    rows[4990] = [4990, "short"]
+    _write_csv(path, rows)
+    # Both parsers skip blank lines, so the ids must still come back in order
+    with open(path, encoding="utf-8-sig") as handle:
+        lines = handle.read().splitlines(keepends=True)
+    with open(path, "w", encoding="utf-8-sig", newline="") as handle:
+        for n, line in enumerate(lines):
+            handle.write(line)
+            if n and n % 100 == 0:
+                handle.write("\r\n")
+
+    ids, _ = _read_ids(path)
+
+    assert ids == list(range(5000))